@@ -7,7 +7,8 @@ This file is the Maharashtra-first Streamlit app with multilingual support (Engl
 and automatic language detection (browser param -> IP region fallback -> Marathi default).
 
 Run:
-    pip install streamlit pyswisseph matplotlib pandas timezonefinder pytz geopy requests
+    pip install streamlit pyswisseph matplotlib pandas tzfpy pytz geopy requests
+    (timezonefinder is used instead of tzfpy if the latter is not installed; numba is optional)
     streamlit run astrocanvas_maharashtra.py
 
 Notes:
@@ -15,21 +16,30 @@ Notes:
 - No cookies or persistent storage are used; manual language selection in sidebar overrides detection for the session.
 """
 
+import importlib
 import math
-import json
 import requests
+from requests.adapters import HTTPAdapter
+import threading
+import time
 from io import BytesIO
 from datetime import datetime, timedelta, date, time as dtime
 
+import numpy as np
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import swisseph as swe
+
+from i18n import TRANSLATIONS as translations, MAR_PLANET_SHORT, MAR_TITHI, MAR_NAK
 
 # Optional utilities
 try:
-    from timezonefinder import TimezoneFinder
     import pytz
+    # Prefer the Rust-backed tzfpy; fall back to the pure-Python timezonefinder
+    try:
+        from tzfpy import get_tz
+        TZF = 'tzfpy'
+    except ImportError:
+        from timezonefinder import TimezoneFinder
+        TZF = 'tzf'
     TZ_AVAILABLE = True
 except Exception:
     TZ_AVAILABLE = False
@@ -40,124 +50,63 @@ try:
 except Exception:
     GEO_AVAILABLE = False
 
-# -------------------- Translations --------------------
-translations = {
-    'en': {
-        'app_title': 'AstroCanvas — Maharashtra Edition',
-        'subtitle': 'Maharashtra-first Vedic Kundali with multilingual support',
-        'birth_data': 'Birth data',
-        'lookup_city': 'Lookup by city (optional)',
-        'city_input': 'City / Place name (e.g., Mumbai, India)',
-        'birth_date': 'Birth Date',
-        'birth_time': 'Birth Time (local)',
-        'latitude': 'Latitude (°)',
-        'longitude': 'Longitude (°)',
-        'auto_tz': 'Auto-detect timezone',
-        'tz_input': 'Timezone offset (hours)',
-        'mode': 'Display mode',
-        'mode_options': ['Maharashtra (North Kundali)','South Indian','Western (Tropical)'],
-        'translit': 'Show Devanagari labels',
-        'generate': 'Generate Kundali',
-        'kundali': 'Kundali',
-        'panchang': 'Panchang',
-        'tithi': 'Tithi',
-        'nakshatra': 'Nakshatra',
-        'yoga': 'Yoga',
-        'karana': 'Karana',
-        'vimshottari': 'Vimshottari Mahadasha',
-        'positions': 'Planetary positions',
-        'download_png': 'Download Kundali PNG',
-        'info_fill': 'Fill inputs in the sidebar and click Generate Kundali',
-        'tz_auto_msg': 'Auto TZ: {tzname} (offset {tz} h)',
-        'not_found': 'Location not found.',
-        'geocode_err': 'Geocoding error: {err}',
-        'panchang_na': 'Panchang could not be computed.'
-    },
-    'mr': {
-        'app_title': 'AstroCanvas — महाराष्ट्र आवृत्ती',
-        'subtitle': 'मराठी-प्राधान्य विकेतिक कौंडली आणि बहुभाषिक समर्थन',
-        'birth_data': 'जन्म माहिती',
-        'lookup_city': 'शहराने शोधा (ऐच्छिक)',
-        'city_input': 'शहर / ठिकाण (उदा. मुंबई, भारत)',
-        'birth_date': 'जन्माची तारीख',
-        'birth_time': 'जन्माची वेळ (स्थानिक)',
-        'latitude': 'अक्षांश (Latitude)',
-        'longitude': 'रेखांश (Longitude)',
-        'auto_tz': 'टाईमझोन आपोआप शोधा',
-        'tz_input': 'टाईमझोन ऑफसेट (तास)',
-        'mode': 'प्रदर्शन पद्धत',
-        'mode_options': ['महाराष्ट्र (North Kundali)','दक्षिण भारतीय','पाश्चात्य (Tropical)'],
-        'translit': 'देवनागरी लेबल दाखवा',
-        'generate': 'कौंडली तयार करा',
-        'kundali': 'कौंडली',
-        'panchang': 'पंचांग',
-        'tithi': 'तिठी',
-        'nakshatra': 'नक्षत्र',
-        'yoga': 'योग',
-        'karana': 'करण',
-        'vimshottari': 'विम्शोत्तरी महासंहिता',
-        'positions': "ग्रहांची स्थिती",
-        'download_png': 'कौंडली PNG डाउनलोड करा',
-        'info_fill': 'साइडबार मधून माहिती भरा आणि "कौंडली तयार करा" क्लिक करा',
-        'tz_auto_msg': 'ऑटो TZ: {tzname} (ऑफसेट {tz} तास)',
-        'not_found': 'स्थळ सापडले नाही.',
-        'geocode_err': 'Geocoding त्रुटी: {err}',
-        'panchang_na': 'पंचांग मोजता आले नाही.'
-    },
-    'hi': {
-        'app_title': 'AstroCanvas — महाराष्ट्र संस्करण',
-        'subtitle': 'महाराष्ट्र-प्राथमिक वैदिक कुंडली और बहुभाषी समर्थन',
-        'birth_data': 'जन्म जानकारी',
-        'lookup_city': 'शहर से खोजें (वैकल्पिक)',
-        'city_input': 'शहर / स्थान (उदा. मुंबई, भारत)',
-        'birth_date': 'जन्म तारीख',
-        'birth_time': 'जन्म समय (स्थानीय)',
-        'latitude': 'अक्षांश (Latitude)',
-        'longitude': 'रेखांश (Longitude)',
-        'auto_tz': 'टाइमज़ोन स्वचालित रूप से खोजें',
-        'tz_input': 'टाइमज़ोन ऑफसेट (घंटे)',
-        'mode': 'प्रदर्शन मोड',
-        'mode_options': ['महाराष्ट्र (North Kundali)','दक्षिण भारतीय','पश्चिमी (Tropical)'],
-        'translit': 'देवनागरी लेबल दिखाएं',
-        'generate': 'कुंडली बनाएं',
-        'kundali': 'कुंडली',
-        'panchang': 'पंचांग',
-        'tithi': 'तिथि',
-        'nakshatra': 'नक्षत्र',
-        'yoga': 'योग',
-        'karana': 'करण',
-        'vimshottari': 'विम्शोत्तरी महामहादशा',
-        'positions': 'ग्रह स्थिति',
-        'download_png': 'कुंडली PNG डाउनलोड करें',
-        'info_fill': 'साइडबार में जानकारी भरें और "कुंडली बनाएं" पर क्लिक करें',
-        'tz_auto_msg': 'ऑटो TZ: {tzname} (ऑफसेट {tz} घँटे)',
-        'not_found': 'स्थान नहीं मिला।',
-        'geocode_err': 'Geocoding त्रुटि: {err}',
-        'panchang_na': 'पंचांग की गणना नहीं हो सकी.'
-    }
-}
+# -------------------- Cached resources --------------------
+# swisseph, matplotlib, pandas and the numba kernels are imported lazily: nothing needs them until Generate is clicked
+@st.cache_resource
+def _swe():
+    import swisseph as swe
+    # Initialise the ephemeris path once per process rather than leaving it to the first calc call
+    swe.set_ephe_path(None)
+    return swe
+
+@st.cache_resource
+def _kernels():
+    # Importing kernels compiles (or loads from numba's cache) the signature-typed kernels
+    import kernels
+    return kernels
+
+@st.cache_resource
+def _warm_kernels():
+    """Start compiling the kernels off the script thread, once per process.
+
+    A Generate click that beats the warm-up waits on the import lock rather than compiling twice.
+    """
+    t = threading.Thread(target=importlib.import_module, args=('kernels',), daemon=True)
+    t.start()
+    return t
+
+if TZ_AVAILABLE:
+    @st.cache_resource
+    def get_tf():
+        # TimezoneFinder loads its polygon data on construction; build it once per process
+        return TimezoneFinder()
+
+    def timezone_name(lat, lon):
+        if TZF == 'tzfpy':
+            return get_tz(lon, lat)
+        return get_tf().timezone_at(lat=lat, lng=lon)
+
+    @st.cache_resource
+    def get_pytz(tzname):
+        return pytz.timezone(tzname)
+
+    @st.cache_data(max_entries=256)
+    def tz_offset_hours(tzname: str, local_dt_iso: str) -> float:
+        loc_dt = get_pytz(tzname).localize(datetime.fromisoformat(local_dt_iso), is_dst=None)
+        return loc_dt.utcoffset().total_seconds() / 3600.0
+
+if GEO_AVAILABLE:
+    @st.cache_data(ttl=86400, show_spinner=False)
+    def geocode_city(q: str):
+        # Cached per query: Nominatim's public endpoint allows ~1 req/s. Errors propagate uncached.
+        loc = Nominatim(user_agent='astrocanvas_geo').geocode(q, timeout=10)
+        return (round(loc.latitude,6), round(loc.longitude,6), loc.address) if loc else None
 
 # -------------------- Marathi / Devanagari helpers --------------------
-DEV_NUM = {0:'०',1:'१',2:'२',3:'३',4:'४',5:'५',6:'६',7:'७',8:'८',9:'९'}
+DEV_TRANS = str.maketrans('0123456789', '०१२३४५६७८९')
 
 def to_devanagari_num(n):
-    s = str(n)
-    return ''.join(DEV_NUM.get(int(ch), ch) for ch in s)
-
-MAR_PLANET_SHORT = {
-    'Sun':'सूर्य','Moon':'चं','Mercury':'बुध','Venus':'शुक्र','Mars':'मं','Jupiter':'गुरु','Saturn':'शनि','Rahu':'राहु','Ketu':'केतु'
-}
-
-MAR_TITHI = [
-    'शुक्ल प्रतिपदा','शुक्ल द्वितीया','शुक्ल तृतीया','शुक्ल चतुर्थी','शुक्ल पंचमी','शुक्ल षष्ठी','शुक्ल सप्तमी','शुक्ल अष्टमी','शुक्ल नवमी','शुक्ल दशमी',
-    'शुक्ल एकादशी','शुक्ल द्वादशी','शुक्ल त्रयोदशी','शुक्ल चतुर्दशी','पुर्णिमा/अमावास्या','कृष्ण प्रतिपदा','कृष्ण द्वितीया','कृष्ण तृतीया','कृष्ण चतुर्थी','कृष्ण पंचमी',
-    'कृष्ण षष्ठी','कृष्ण सप्तमी','कृष्ण अष्टमी','कृष्ण नवमी','कृष्ण दशमी','कृष्ण एकादशी','कृष्ण द्वादशी','कृष्ण त्रयोदशी','कृष्ण चतुर्दशी','अमावास्या/पुर्णिमा'
-]
-
-MAR_NAK = [
-    'अश्विनी','भरणी','कृत्तिका','रोहिणी','मृगशीर्ष','आर्द्रा','पुनर्वसु','पुष्य','आश्लेषा','मघा','पूर्व फाल्गुनी','उत्तर फाल्गुनी','हस्त','चित्रा','स्वाती','विशाखा',
-    'अनुराधा','ज्येष्ठा','मूल','पूर्वाषाढा','उत्तराषाढा','श्रवण','धनिष्ठा','शतभिषा','पूर्वभाद्रपदा','उत्तरभाद्रपदा','रेवती'
-]
+    return str(n).translate(DEV_TRANS)
 
 # -------------------- Astrological constants --------------------
 SIGNS_EN = ['Aries','Taurus','Gemini','Cancer','Leo','Virgo','Libra','Scorpio','Sagittarius','Capricorn','Aquarius','Pisces']
@@ -165,76 +114,117 @@ SIGNS_DEV = ['मेष','वृषभ','मिथुन','कर्क','सि
 
 VIM_DASHA_ORDER = ['Ketu','Venus','Sun','Moon','Mars','Rahu','Jupiter','Saturn','Mercury']
 VIM_DASHA_YEARS = {'Ketu':7,'Venus':20,'Sun':6,'Moon':10,'Mars':7,'Rahu':18,'Jupiter':16,'Saturn':19,'Mercury':17}
+VIM_YEARS_ARR = np.array([VIM_DASHA_YEARS[l] for l in VIM_DASHA_ORDER], dtype=np.float64)
+
+# Bodies as parallel fixed-order tuples; per-chart values are arrays/dicts in this order
+PLANET_NAMES = ('Sun','Moon','Mercury','Venus','Mars','Jupiter','Saturn')
+KUNDALI_BODIES = PLANET_NAMES + ('Rahu','Ketu')
+BENEFICS = frozenset(('Sun','Moon','Venus','Jupiter','Mercury'))
 
 # -------------------- Helpers --------------------
 def normalize(lon):
     return lon % 360.0
 
-def sign_index(lon):
-    return int((lon % 360.0) // 30)
+# Array forms for whole position vectors: one NumPy pass instead of a Python call per body
+def normalize_arr(lons):
+    return np.mod(lons, 360.0)
 
-def dms(angle):
-    angle = normalize(angle)
-    deg = int(angle)
-    rem = (angle - deg) * 60
-    minute = int(rem)
-    second = int((rem - minute) * 60)
-    return deg, minute, second
+def sign_index_arr(lons):
+    return (np.mod(lons, 360.0) // 30).astype(np.int8)
 
 # -------------------- Ayanamsa --------------------
-def get_lahiri_ayanamsa(jd_ut):
+@st.cache_resource
+def _ayanamsa_fn():
+    """Probe once which ayanamsa API this pyswisseph build provides and return it."""
+    swe = _swe()
     try:
-        a = swe.get_ayanamsa_ut(jd_ut)
-        return a / 3600.0
+        swe.get_ayanamsa_ut(2451545.0)
+        return lambda jd: swe.get_ayanamsa_ut(jd) / 3600.0
     except Exception:
-        try:
-            a = swe.get_ayanamsa(jd_ut)
-            return a
-        except Exception:
-            return 0.0
+        pass
+    try:
+        swe.get_ayanamsa(2451545.0)
+        return swe.get_ayanamsa
+    except Exception:
+        return lambda jd: 0.0
+
+def get_lahiri_ayanamsa(jd_ut):
+    return _ayanamsa_fn()(jd_ut)
 
 # -------------------- Compute positions --------------------
-def compute_chart(date_str, time_str, tz_hours, lat, lon, sidereal=True, topo=True):
-    dt_local = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
-    dt_ut = dt_local - timedelta(hours=tz_hours)
+def compute_chart(bdate, btime, tz_hours, lat, lon, sidereal=True, topo=True):
+    """Compose the cached ephemeris pieces into a chart; the sidereal shift is applied here,
+    so switching display mode reuses the cached planets and houses.
+    """
+    # Round coordinates so float noise from the number inputs doesn't miss the cache
+    lat, lon = round(lat, 6), round(lon, 6)
+    jd_ut, dt_ut = _calc_jd(bdate, btime, tz_hours)
+    ayanamsa = get_lahiri_ayanamsa(jd_ut)
+    ay = ayanamsa if sidereal else 0.0
+
+    lons, spds, node = _calc_planets(jd_ut, lat, lon, topo)
+    pos = dict(zip(PLANET_NAMES, normalize_arr(np.asarray(lons) - ay).tolist()))
+    speed = dict(zip(PLANET_NAMES, spds))
+
+    # Nodes
+    if node is not None:
+        rn_lon = normalize(node - ay)
+        pos['Rahu'] = rn_lon
+        pos['Ketu'] = normalize(rn_lon + 180)
+    else:
+        pos['Rahu'] = None
+        pos['Ketu'] = None
+
+    # Ascendant (whole sign for simple kundali mapping)
+    ascmc = _calc_houses(jd_ut, lat, lon)
+    if ascmc is not None:
+        asc = normalize(ascmc[0] - ay)
+        mc = normalize(ascmc[1] - ay)
+    else:
+        asc, mc = None, None
+
+    return {'jd_ut': jd_ut, 'dt_ut': dt_ut.isoformat(), 'positions':pos, 'speeds':speed, 'asc':asc, 'mc':mc, 'ayanamsa':ayanamsa, 'sidereal':sidereal}
+
+def _calc_jd(bdate: date, btime: dtime, tz_hours):
+    # Not cached: julday is cheaper than a cache_data lookup
+    swe = _swe()
+    dt_ut = datetime.combine(bdate, btime) - timedelta(hours=tz_hours)
     jd_ut = swe.julday(dt_ut.year, dt_ut.month, dt_ut.day, dt_ut.hour + dt_ut.minute/60.0, swe.GREG_CAL)
+    return jd_ut, dt_ut
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def _calc_planets(jd_ut, lat, lon, topo):
+    """Tropical (lons, speeds, true node) for PLANET_NAMES; node is None if it can't be computed."""
+    swe = _swe()
     if topo:
         swe.set_topo(lon, lat, 0)
 
     flags = swe.FLG_SWIEPH | swe.FLG_TOPOCTR
 
-    bodies = [("Sun",swe.SUN),("Moon",swe.MOON),("Mercury",swe.MERCURY),("Venus",swe.VENUS),("Mars",swe.MARS),("Jupiter",swe.JUPITER),("Saturn",swe.SATURN)]
-    pos = {}
-    speed = {}
-    ay = get_lahiri_ayanamsa(jd_ut) if sidereal else 0.0
-
-    for name,bid in bodies:
-        xx, serr = swe.calc_ut(jd_ut, bid, flags)
-        lon_val = normalize(xx[0] - (ay if sidereal else 0.0))
-        pos[name] = lon_val
-        speed[name] = xx[3]
+    bids = (swe.SUN, swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS, swe.JUPITER, swe.SATURN)
+    # Only longitude and its speed are used; write them straight into preallocated arrays
+    lons = np.empty(len(bids))
+    spds = np.empty(len(bids))
+    for i, bid in enumerate(bids):
+        xx, _ = swe.calc_ut(jd_ut, bid, flags)
+        lons[i] = xx[0]
+        spds[i] = xx[3]
 
-    # Nodes
     try:
         rn, serr = swe.calc_ut(jd_ut, swe.TRUE_NODE, flags)
-        rn_lon = normalize(rn[0] - (ay if sidereal else 0.0))
-        kn_lon = normalize(rn_lon + 180)
-        pos['Rahu'] = rn_lon
-        pos['Ketu'] = kn_lon
+        node = rn[0]
     except Exception:
-        pos['Rahu'] = None
-        pos['Ketu'] = None
+        node = None
+    return lons.tolist(), spds.tolist(), node
 
-    # Ascendant (whole sign for simple kundali mapping)
+@st.cache_data(max_entries=64, show_spinner=False)
+def _calc_houses(jd_ut, lat, lon):
+    """Tropical (asc, mc) for whole-sign houses, or None if houses can't be computed."""
     try:
-        ascmc, cusps = swe.houses(jd_ut, lat, lon, b'W')
-        asc = normalize(ascmc[0] - (ay if sidereal else 0.0))
-        mc = normalize(ascmc[1] - (ay if sidereal else 0.0))
+        ascmc, cusps = _swe().houses(jd_ut, lat, lon, b'W')
     except Exception:
-        asc, mc = None, None
-
-    return {'jd_ut': jd_ut, 'dt_ut': dt_ut.isoformat(), 'positions':pos, 'speeds':speed, 'asc':asc, 'mc':mc}
+        return None
+    return ascmc[0], ascmc[1]
 
 # -------------------- Panchang & Vimshottari --------------------
 def compute_panchang(pos):
@@ -242,16 +232,11 @@ def compute_panchang(pos):
     moon = pos.get('Moon')
     if sun is None or moon is None:
         return None
-    diff = normalize(moon - sun)
-    tithi_index = int(diff // 12)
-
-    nak_index = int(moon // (360.0/27.0))
-
-    yoga_val = normalize(sun + moon)
-    yoga_index = int(yoga_val // (360.0/27.0))
-
-    karana_index = (tithi_index * 2) % 11
+    return _panch_cached(float(sun), float(moon))
 
+@st.cache_data(max_entries=128, show_spinner=False)
+def _panch_cached(sun: float, moon: float):
+    tithi_index, nak_index, yoga_index, karana_index = _kernels().panch_core(sun, moon)
     return {'tithi_idx':tithi_index, 'tithi_mar':MAR_TITHI[tithi_index], 'nak_idx':nak_index, 'nak_mar':MAR_NAK[nak_index], 'yoga_idx':yoga_index, 'karana_idx':karana_index}
 
 
@@ -259,31 +244,41 @@ def vimshottari(pos):
     moon_lon = pos.get('Moon')
     if moon_lon is None:
         return None
-    nak_index = int(moon_lon // (360.0/27.0))
-    order = VIM_DASHA_ORDER
-    mapping = [order[i%9] for i in range(27)]
-    start_lord = mapping[nak_index]
-    nak_deg = moon_lon % (360.0/27.0)
-    frac = nak_deg / (360.0/27.0)
-    total_years = VIM_DASHA_YEARS[start_lord]
-    balance = (1 - frac) * total_years
-    seq = [{'lord':start_lord, 'years':balance, 'from_now':0.0}]
-    idx0 = order.index(start_lord)
-    running = balance
-    for i in range(1,9):
-        lord = order[(idx0 + i) % 9]
-        years = VIM_DASHA_YEARS[lord]
-        seq.append({'lord':lord, 'years':years, 'from_now':running})
-        running += years
-    return seq
+    return _vim_cached(float(moon_lon))
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _vim_cached(moon_lon: float):
+    seq = _kernels().vim_core(moon_lon, VIM_YEARS_ARR)
+    return [{'lord':VIM_DASHA_ORDER[int(li)], 'years':years, 'from_now':from_now} for li, years, from_now in seq.tolist()]
 
 # -------------------- Maharashtra-specific Kundali drawing --------------------
 
-def draw_kundali_maharashtra(pos, asc, translit=True, highlight_mumbai=True):
-    """Draw a North-Indian diamond kundali with Marathi labels and Devanagari numerals for houses.
-    highlight_mumbai: if True, customize colors/icons used in Maharashtra style (subtle)
+KUNDALI_DPI = 120           # on-screen preview: 720x720 px, ample for the column-width display
+KUNDALI_DOWNLOAD_DPI = 220  # downloaded PNG keeps the original print resolution
+PREVIEW_PNG_COMPRESS = 1    # zlib level for the in-memory preview; downloads keep the default (6)
+
+# Planet label styling, built once instead of per label (Text copies the bbox props)
+PLANET_TEXT_KW = dict(fontsize=12, ha='center', va='center')
+BENEFIC_BBOX = dict(facecolor='white', edgecolor='#0b5394', boxstyle='round', alpha=0.9)
+MALEFIC_BBOX = dict(facecolor='white', edgecolor='#b30000', boxstyle='round', alpha=0.9)
+
+# Sign centers around diamond (clockwise starting at top = Aries in North Indian); static, so computed once
+SIGN_CENTERS = tuple(
+    (2 + 1.4 * math.cos(math.radians(a)), 2 + 1.4 * math.sin(math.radians(a)))
+    for a in (90,30,-30,-90,-150,-210,-270,-330,90,30,-30,-90)
+)
+
+@st.cache_resource
+def _base_kundali_fig():
+    """Build the static part of the kundali (diamond, sign labels, house numerals, title) once per process.
+    Returns (fig, ax, lock); the lock serialises the shared figure across sessions.
     """
-    fig, ax = plt.subplots(figsize=(6,6))
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(6,6))
+    ax = fig.subplots()
     ax.set_xlim(0,4)
     ax.set_ylim(0,4)
     ax.axis('off')
@@ -293,43 +288,100 @@ def draw_kundali_maharashtra(pos, asc, translit=True, highlight_mumbai=True):
     xs, ys = zip(*diamond)
     ax.plot(xs, ys, color='#2b2b2b', lw=2)
 
-    # Compute sign centers around diamond (clockwise starting at top = Aries in North Indian)
-    sign_centers = []
-    for angle in [90,30,-30,-90,-150,-210,-270,-330,90,30,-30,-90][:12]:
-        rad = math.radians(angle)
-        x = 2 + 1.4 * math.cos(rad)
-        y = 2 + 1.4 * math.sin(rad)
-        sign_centers.append((x,y))
-
     # Place Devanagari numerals for houses in Maharashtra convention (1-12 in Devanagari)
-    for i,(sx,sy) in enumerate(sign_centers):
+    for i,(sx,sy) in enumerate(SIGN_CENTERS):
         house_num = to_devanagari_num(i+1)
         ax.text(sx, sy+0.45, SIGNS_DEV[i], fontsize=12, ha='center', va='center', fontweight='bold')
         ax.text(sx, sy+0.22, house_num, fontsize=11, ha='center', va='center', color='#6b7280')
 
-    # Place planets (Marathi short names)
-    for name in ['Sun','Moon','Mercury','Venus','Mars','Jupiter','Saturn','Rahu','Ketu']:
-        lon = pos.get(name)
-        if lon is None:
-            continue
-        idx = sign_index(lon)
-        x,y = sign_centers[idx]
-        label = MAR_PLANET_SHORT.get(name, name if not translit else name)
-        # Color by benefic/malefic simplified
-        color = '#0b5394' if name in ['Sun','Moon','Venus','Jupiter','Mercury'] else '#b30000'
-        bbox = dict(facecolor='white', edgecolor=color, boxstyle='round', alpha=0.9)
-        ax.text(x, y-0.15, label, fontsize=12, ha='center', va='center', bbox=bbox)
-
     # Title & footer
     ax.set_title('आस्थ्रोकॅनव्हास — कौंडली (महाराष्ट्र शैली)', fontsize=13)
+    # Lay out once here instead of a bbox_inches='tight' pass on every savefig
+    fig.tight_layout()
+    return fig, ax, threading.Lock()
+
+def draw_kundali_maharashtra(pos, asc, translit=True, highlight_mumbai=True, dpi=KUNDALI_DPI, compress_level=None):
+    """Draw a North-Indian diamond kundali with Marathi labels and Devanagari numerals for houses.
+    highlight_mumbai: if True, customize colors/icons used in Maharashtra style (subtle)
+    Only the planet labels are added per call; the static base figure is shared.
+    compress_level: PNG zlib level (None keeps the encoder default).
+    """
+    fig, ax, lock = _base_kundali_fig()
     buf = BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight', dpi=220)
-    plt.close(fig)
-    buf.seek(0)
-    return buf.read()
+    with lock:
+        labels = []
+        try:
+            # Place planets (Marathi short names)
+            names = [n for n in KUNDALI_BODIES if pos.get(n) is not None]
+            idxs = sign_index_arr(np.array([pos[n] for n in names], dtype=np.float64))
+            for name, idx in zip(names, idxs.tolist()):
+                x,y = SIGN_CENTERS[idx]
+                label = MAR_PLANET_SHORT.get(name, name if not translit else name)
+                # Color by benefic/malefic simplified
+                bbox = BENEFIC_BBOX if name in BENEFICS else MALEFIC_BBOX
+                labels.append(ax.text(x, y-0.15, label, bbox=bbox, **PLANET_TEXT_KW))
+
+            pil_kwargs = None if compress_level is None else {'compress_level': compress_level}
+            fig.savefig(buf, format='png', dpi=dpi, pil_kwargs=pil_kwargs)
+        finally:
+            # Restore the base figure for the next render
+            for t in labels:
+                t.remove()
+    return buf.getvalue()
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _render_kundali(pos_tuple: tuple, asc: float, translit: bool, dpi: int = KUNDALI_DPI, compress_level=PREVIEW_PNG_COMPRESS) -> bytes:
+    """PNG bytes for draw_kundali_maharashtra, memoized on the (hashable) positions and output settings."""
+    return draw_kundali_maharashtra(dict(pos_tuple), asc, translit=translit, dpi=dpi, compress_level=compress_level)
 
 # -------------------- Language detection --------------------
 
+@st.cache_resource
+def _http():
+    """Process-wide keep-alive session so cache misses reuse the TCP/TLS connection."""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=2))
+    return session
+
+def _fetch_ip_lang(timeout):
+    r = _http().get('https://ipapi.co/json/', timeout=timeout)
+    if r.status_code != 200:
+        return None
+    info = r.json()
+    region = info.get('region', '').lower()
+    country = info.get('country_name', '')
+    # Maharashtra region names check
+    if 'maharashtra' in region or 'maharashtra' in info.get('region_code','').lower():
+        return 'mr'
+    if country == 'India':
+        # default to Hindi for India unless browser says otherwise
+        return 'hi'
+    return None
+
+IP_LANG_TTL = 3600  # seconds; applies to both the cached lookup and the background retry result
+
+@st.cache_data(ttl=IP_LANG_TTL, show_spinner=False)
+def _ip_lang():
+    """IP-based language guess with a short budget so first paint isn't held up.
+    Network errors propagate so they are not cached.
+    """
+    return _fetch_ip_lang((0.3, 0.5))
+
+@st.cache_resource
+def _ip_lang_background():
+    """Process-wide slot for a background retry after a timed-out lookup:
+    'result' is (lang, monotonic time fetched), 'pending' is set while a retry runs.
+    """
+    return {'lock': threading.Lock()}
+
+def _refresh_ip_lang(slot):
+    try:
+        slot['result'] = (_fetch_ip_lang((1, 2)), time.monotonic())
+    except Exception:
+        pass
+    finally:
+        slot['pending'] = False
+
 def detect_language():
     # 1) Query params (allow ?lang= to override/detect browser-based language)
     q = st.experimental_get_query_params()
@@ -344,31 +396,111 @@ def detect_language():
             return 'en'
     # 2) Try to use HTTP headers via Streamlit's _request_session (best-effort)
     # Note: Streamlit doesn't expose headers reliably; skip.
-    # 3) IP-based geolocation fallback
-    try:
-        r = requests.get('https://ipapi.co/json/', timeout=3)
-        if r.status_code == 200:
-            info = r.json()
-            region = info.get('region', '').lower()
-            country = info.get('country_name', '')
-            # Maharashtra region names check
-            if 'maharashtra' in region or 'maharashtra' in info.get('region_code','').lower():
-                return 'mr'
-            if country == 'India':
-                # default to Hindi for India unless browser says otherwise
-                return 'hi'
-    except Exception:
-        pass
-    # Fallback default
-    return 'mr'
+    # 3) IP-based geolocation fallback, resolved once per session
+    if 'detected_lang' not in st.session_state:
+        slot = _ip_lang_background()
+        result = slot.get('result')
+        if result is not None and time.monotonic() - result[1] < IP_LANG_TTL:
+            lang = result[0]
+        elif slot.get('pending'):
+            # A retry is already in flight; don't block this session on the network again
+            lang = None
+        else:
+            try:
+                lang = _ip_lang()
+            except requests.Timeout:
+                # Fall back optimistically and let later sessions pick up the slower answer
+                with slot['lock']:
+                    if not slot.get('pending'):
+                        slot['pending'] = True
+                        threading.Thread(target=_refresh_ip_lang, args=(slot,), daemon=True).start()
+                lang = None
+            except Exception:
+                lang = None
+        # Fallback default
+        st.session_state['detected_lang'] = lang or 'mr'
+    return st.session_state['detected_lang']
+
+# -------------------- Results panel --------------------
+
+# st.fragment (Streamlit >= 1.37) / st.experimental_fragment (1.33-1.36); plain call on older versions
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda f: f)
+
+@_fragment
+def render_results(data, L):
+    """Render kundali, panchang, dasha and positions for a computed chart.
+    Runs as a fragment so interactions inside it (the label toggle, the download button) rerun only this panel.
+    """
+    import pandas as pd
+
+    # Display-only toggle lives inside the fragment so flipping it doesn't rerun the whole app.
+    # The choice is mirrored in session state because the widget resets when its (translated) label changes.
+    translit = st.checkbox(L['translit'], value=st.session_state.get('translit', True))
+    st.session_state['translit'] = translit
+    pos_tuple = tuple(sorted(data['positions'].items()))
+    kundali_png = _render_kundali(pos_tuple, data['asc'], translit)
+
+    panch = compute_panchang(data['positions'])
+    dasha = vimshottari(data['positions']) if data['sidereal'] else None
+
+    c1, c2 = st.columns([1.1, 0.9])
+    with c1:
+        st.subheader(L['kundali'])
+        st.image(kundali_png, use_column_width=True)
+        # The high-DPI render is opt-in: download_button needs its bytes up front, and rendering
+        # them for every new chart would cost more than the preview itself
+        if st.checkbox(L['prepare_png'], value=False):
+            hires_png = _render_kundali(pos_tuple, data['asc'], translit, KUNDALI_DOWNLOAD_DPI, None)
+            st.download_button(L['download_png'], data=hires_png, file_name='kundali_maharashtra.png', mime='image/png')
+    with c2:
+        st.subheader(L['panchang'])
+        if panch:
+            st.write(f"{L['tithi']}: {panch['tithi_mar']} (index {panch['tithi_idx']})")
+            st.write(f"{L['nakshatra']}: {panch['nak_mar']} (index {panch['nak_idx']})")
+            st.write(f"{L['yoga']}: index {panch['yoga_idx']}")
+            st.write(f"{L['karana']}: index {panch['karana_idx']}")
+        else:
+            st.info(L['panchang_na'])
+
+        st.markdown('---')
+        st.subheader(L['vimshottari'])
+        if dasha is None:
+            st.info(L['panchang_na'])
+        else:
+            for entry in dasha:
+                st.write(f"{entry['lord']}: {entry['years']:.3f} years (from {entry['from_now']:.3f})")
+
+    # Planetary positions table
+    names = [k for k,v in data['positions'].items() if v is not None]
+    lons = np.array([data['positions'][k] for k in names], dtype=np.float64)
+    deg = lons.astype(int)
+    rem = (lons - deg) * 60
+    minute = rem.astype(int)
+    second = ((rem - minute) * 60).astype(int)
+    sign_idx = sign_index_arr(lons)
+    df = pd.DataFrame({
+        'Body_En': names,
+        'Body_Mar': [MAR_PLANET_SHORT.get(k, k) for k in names],
+        'Longitude': lons.round(6),
+        'Sign_En': np.array(SIGNS_EN)[sign_idx],
+        'Sign_Mar': np.array(SIGNS_DEV)[sign_idx],
+        'Deg': deg, 'Min': minute, 'Sec': second,
+    })
+    st.subheader(L['positions'])
+    if translit and st.session_state['lang'] in ['mr','hi']:
+        st.dataframe(df[['Body_Mar','Longitude','Sign_Mar','Deg','Min','Sec']])
+    else:
+        st.dataframe(df[['Body_En','Longitude','Sign_En','Deg','Min','Sec']])
+
+    st.caption(f"UTC: {data['dt_ut']} | Ayanamsa (deg): {data['ayanamsa']:.6f}")
 
 # -------------------- Streamlit UI --------------------
 
-# Initial detection
-detected_lang = detect_language()
-# Session state: allow user override
+_warm_kernels()
+
+# Initial detection (first run of the session only); session state allows user override
 if 'lang' not in st.session_state:
-    st.session_state['lang'] = detected_lang
+    st.session_state['lang'] = detect_language()
 
 # Sidebar language selector
 lang_labels = {'en': 'English', 'mr': 'मराठी', 'hi': 'हिन्दी'}
@@ -407,13 +539,9 @@ with st.sidebar:
     tz = None
     if tz_auto and TZ_AVAILABLE:
         try:
-            tf = TimezoneFinder()
-            tzname = tf.timezone_at(lat=lat, lng=lon)
+            tzname = timezone_name(lat, lon)
             if tzname:
-                tz_obj = pytz.timezone(tzname)
-                local_dt = datetime.combine(bdate, btime)
-                loc_dt = tz_obj.localize(local_dt, is_dst=None)
-                tz = loc_dt.utcoffset().total_seconds() / 3600.0
+                tz = tz_offset_hours(tzname, datetime.combine(bdate, btime).isoformat())
                 st.sidebar.write(L['tz_auto_msg'].format(tzname=tzname, tz=tz))
             else:
                 tz = st.number_input(L['tz_input'], value=5.5, step=0.25)
@@ -424,18 +552,16 @@ with st.sidebar:
 
     st.header(L['mode'])
     mode = st.selectbox('', options=L['mode_options'])
-    translit = st.checkbox(L['translit'], value=True)
     st.markdown('---')
     generate = st.button(L['generate'])
 
 # Geocode city if requested
 if use_city and city_query and GEO_AVAILABLE:
-    geolocator = Nominatim(user_agent='astrocanvas_geo')
     try:
-        loc = geolocator.geocode(city_query, timeout=10)
-        if loc:
-            lat, lon = round(loc.latitude,6), round(loc.longitude,6)
-            st.sidebar.success(f"Found: {loc.address} -> ({lat}, {lon})")
+        res = geocode_city(city_query)
+        if res:
+            lat, lon, address = res
+            st.sidebar.success(f"Found: {address} -> ({lat}, {lon})")
         else:
             st.sidebar.error(L['not_found'])
     except Exception as e:
@@ -443,54 +569,11 @@ if use_city and city_query and GEO_AVAILABLE:
 
 if generate:
     sidereal = not mode.startswith('Western') and not mode.startswith('पाश्चात्य')
-    data = compute_chart(bdate.strftime('%Y-%m-%d'), btime.strftime('%H:%M'), float(tz), float(lat), float(lon), sidereal=sidereal)
-
-    kundali_png = draw_kundali_maharashtra(data['positions'], data['asc'], translit=translit)
-
-    panch = compute_panchang(data['positions'])
-    dasha = vimshottari(data['positions']) if sidereal else None
-
-    c1, c2 = st.columns([1.1, 0.9])
-    with c1:
-        st.subheader(L['kundali'])
-        st.image(kundali_png, use_column_width=True)
-        st.download_button(L['download_png'], data=kundali_png, file_name='kundali_maharashtra.png', mime='image/png')
-    with c2:
-        st.subheader(L['panchang'])
-        if panch:
-            st.write(f"{L['tithi']}: {panch['tithi_mar']} (index {panch['tithi_idx']})")
-            st.write(f"{L['nakshatra']}: {panch['nak_mar']} (index {panch['nak_idx']})")
-            st.write(f"{L['yoga']}: index {panch['yoga_idx']}")
-            st.write(f"{L['karana']}: index {panch['karana_idx']}")
-        else:
-            st.info(L['panchang_na'])
-
-        st.markdown('---')
-        st.subheader(L['vimshottari'])
-        if dasha is None:
-            st.info(L['panchang_na'])
-        else:
-            for entry in dasha:
-                st.write(f"{entry['lord']}: {entry['years']:.3f} years (from {entry['from_now']:.3f})")
-
-    # Planetary positions table
-    rows = []
-    for k,v in data['positions'].items():
-        if v is None:
-            continue
-        deg, minute, second = dms(v)
-        sign_en = SIGNS_EN[sign_index(v)]
-        sign_dev = SIGNS_DEV[sign_index(v)]
-        name_dev = MAR_PLANET_SHORT.get(k, k)
-        rows.append({'Body_En':k, 'Body_Mar':name_dev, 'Longitude':round(v,6), 'Sign_En':sign_en, 'Sign_Mar':sign_dev, 'Deg':deg, 'Min':minute, 'Sec':second})
-    df = pd.DataFrame(rows)
-    st.subheader(L['positions'])
-    if translit and st.session_state['lang'] in ['mr','hi']:
-        st.dataframe(df[['Body_Mar','Longitude','Sign_Mar','Deg','Min','Sec']])
-    else:
-        st.dataframe(df[['Body_En','Longitude','Sign_En','Deg','Min','Sec']])
+    # Kept in session state so later reruns (e.g. a language change) re-render without recomputing
+    st.session_state['chart_data'] = compute_chart(bdate, btime, float(tz), float(lat), float(lon), sidereal=sidereal)
 
-    st.caption(f"UTC: {data['dt_ut']} | Ayanamsa (deg): {get_lahiri_ayanamsa(data['jd_ut']):.6f}")
+if 'chart_data' in st.session_state:
+    render_results(st.session_state['chart_data'], L)
 else:
     st.info(L['info_fill'])
 
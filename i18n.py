@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+UI translations and Marathi label tables for AstroCanvas.
+
+Kept out of app.py so Streamlit's per-interaction script rerun doesn't rebuild them;
+the module is imported once per process and the read-only views are shared.
+"""
+
+from types import MappingProxyType
+
+# -------------------- Translations --------------------
+TRANSLATIONS = MappingProxyType({
+    'en': MappingProxyType({
+        'app_title': 'AstroCanvas — Maharashtra Edition',
+        'subtitle': 'Maharashtra-first Vedic Kundali with multilingual support',
+        'birth_data': 'Birth data',
+        'lookup_city': 'Lookup by city (optional)',
+        'city_input': 'City / Place name (e.g., Mumbai, India)',
+        'birth_date': 'Birth Date',
+        'birth_time': 'Birth Time (local)',
+        'latitude': 'Latitude (°)',
+        'longitude': 'Longitude (°)',
+        'auto_tz': 'Auto-detect timezone',
+        'tz_input': 'Timezone offset (hours)',
+        'mode': 'Display mode',
+        'mode_options': ('Maharashtra (North Kundali)','South Indian','Western (Tropical)'),
+        'translit': 'Show Devanagari labels',
+        'generate': 'Generate Kundali',
+        'kundali': 'Kundali',
+        'panchang': 'Panchang',
+        'tithi': 'Tithi',
+        'nakshatra': 'Nakshatra',
+        'yoga': 'Yoga',
+        'karana': 'Karana',
+        'vimshottari': 'Vimshottari Mahadasha',
+        'positions': 'Planetary positions',
+        'download_png': 'Download Kundali PNG',
+        'prepare_png': 'Prepare high-resolution PNG',
+        'info_fill': 'Fill inputs in the sidebar and click Generate Kundali',
+        'tz_auto_msg': 'Auto TZ: {tzname} (offset {tz} h)',
+        'not_found': 'Location not found.',
+        'geocode_err': 'Geocoding error: {err}',
+        'panchang_na': 'Panchang could not be computed.'
+    }),
+    'mr': MappingProxyType({
+        'app_title': 'AstroCanvas — महाराष्ट्र आवृत्ती',
+        'subtitle': 'मराठी-प्राधान्य विकेतिक कौंडली आणि बहुभाषिक समर्थन',
+        'birth_data': 'जन्म माहिती',
+        'lookup_city': 'शहराने शोधा (ऐच्छिक)',
+        'city_input': 'शहर / ठिकाण (उदा. मुंबई, भारत)',
+        'birth_date': 'जन्माची तारीख',
+        'birth_time': 'जन्माची वेळ (स्थानिक)',
+        'latitude': 'अक्षांश (Latitude)',
+        'longitude': 'रेखांश (Longitude)',
+        'auto_tz': 'टाईमझोन आपोआप शोधा',
+        'tz_input': 'टाईमझोन ऑफसेट (तास)',
+        'mode': 'प्रदर्शन पद्धत',
+        'mode_options': ('महाराष्ट्र (North Kundali)','दक्षिण भारतीय','पाश्चात्य (Tropical)'),
+        'translit': 'देवनागरी लेबल दाखवा',
+        'generate': 'कौंडली तयार करा',
+        'kundali': 'कौंडली',
+        'panchang': 'पंचांग',
+        'tithi': 'तिठी',
+        'nakshatra': 'नक्षत्र',
+        'yoga': 'योग',
+        'karana': 'करण',
+        'vimshottari': 'विम्शोत्तरी महासंहिता',
+        'positions': "ग्रहांची स्थिती",
+        'download_png': 'कौंडली PNG डाउनलोड करा',
+        'prepare_png': 'उच्च-रिझोल्यूशन PNG तयार करा',
+        'info_fill': 'साइडबार मधून माहिती भरा आणि "कौंडली तयार करा" क्लिक करा',
+        'tz_auto_msg': 'ऑटो TZ: {tzname} (ऑफसेट {tz} तास)',
+        'not_found': 'स्थळ सापडले नाही.',
+        'geocode_err': 'Geocoding त्रुटी: {err}',
+        'panchang_na': 'पंचांग मोजता आले नाही.'
+    }),
+    'hi': MappingProxyType({
+        'app_title': 'AstroCanvas — महाराष्ट्र संस्करण',
+        'subtitle': 'महाराष्ट्र-प्राथमिक वैदिक कुंडली और बहुभाषी समर्थन',
+        'birth_data': 'जन्म जानकारी',
+        'lookup_city': 'शहर से खोजें (वैकल्पिक)',
+        'city_input': 'शहर / स्थान (उदा. मुंबई, भारत)',
+        'birth_date': 'जन्म तारीख',
+        'birth_time': 'जन्म समय (स्थानीय)',
+        'latitude': 'अक्षांश (Latitude)',
+        'longitude': 'रेखांश (Longitude)',
+        'auto_tz': 'टाइमज़ोन स्वचालित रूप से खोजें',
+        'tz_input': 'टाइमज़ोन ऑफसेट (घंटे)',
+        'mode': 'प्रदर्शन मोड',
+        'mode_options': ('महाराष्ट्र (North Kundali)','दक्षिण भारतीय','पश्चिमी (Tropical)'),
+        'translit': 'देवनागरी लेबल दिखाएं',
+        'generate': 'कुंडली बनाएं',
+        'kundali': 'कुंडली',
+        'panchang': 'पंचांग',
+        'tithi': 'तिथि',
+        'nakshatra': 'नक्षत्र',
+        'yoga': 'योग',
+        'karana': 'करण',
+        'vimshottari': 'विम्शोत्तरी महामहादशा',
+        'positions': 'ग्रह स्थिति',
+        'download_png': 'कुंडली PNG डाउनलोड करें',
+        'prepare_png': 'उच्च-रिज़ॉल्यूशन PNG तैयार करें',
+        'info_fill': 'साइडबार में जानकारी भरें और "कुंडली बनाएं" पर क्लिक करें',
+        'tz_auto_msg': 'ऑटो TZ: {tzname} (ऑफसेट {tz} घँटे)',
+        'not_found': 'स्थान नहीं मिला।',
+        'geocode_err': 'Geocoding त्रुटि: {err}',
+        'panchang_na': 'पंचांग की गणना नहीं हो सकी.'
+    }),
+})
+
+# -------------------- Marathi labels --------------------
+MAR_PLANET_SHORT = MappingProxyType({
+    'Sun':'सूर्य','Moon':'चं','Mercury':'बुध','Venus':'शुक्र','Mars':'मं','Jupiter':'गुरु','Saturn':'शनि','Rahu':'राहु','Ketu':'केतु'
+})
+
+MAR_TITHI = (
+    'शुक्ल प्रतिपदा','शुक्ल द्वितीया','शुक्ल तृतीया','शुक्ल चतुर्थी','शुक्ल पंचमी','शुक्ल षष्ठी','शुक्ल सप्तमी','शुक्ल अष्टमी','शुक्ल नवमी','शुक्ल दशमी',
+    'शुक्ल एकादशी','शुक्ल द्वादशी','शुक्ल त्रयोदशी','शुक्ल चतुर्दशी','पुर्णिमा/अमावास्या','कृष्ण प्रतिपदा','कृष्ण द्वितीया','कृष्ण तृतीया','कृष्ण चतुर्थी','कृष्ण पंचमी',
+    'कृष्ण षष्ठी','कृष्ण सप्तमी','कृष्ण अष्टमी','कृष्ण नवमी','कृष्ण दशमी','कृष्ण एकादशी','कृष्ण द्वादशी','कृष्ण त्रयोदशी','कृष्ण चतुर्दशी','अमावास्या/पुर्णिमा'
+)
+
+MAR_NAK = (
+    'अश्विनी','भरणी','कृत्तिका','रोहिणी','मृगशीर्ष','आर्द्रा','पुनर्वसु','पुष्य','आश्लेषा','मघा','पूर्व फाल्गुनी','उत्तर फाल्गुनी','हस्त','चित्रा','स्वाती','विशाखा',
+    'अनुराधा','ज्येष्ठा','मूल','पूर्वाषाढा','उत्तराषाढा','श्रवण','धनिष्ठा','शतभिषा','पूर्वभाद्रपदा','उत्तरभाद्रपदा','रेवती'
+)
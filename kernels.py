@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Numeric kernels for AstroCanvas (panchang, vimshottari).
+
+Compiled with numba when it is installed, otherwise run as plain Python. They live
+outside app.py so Streamlit's script rerun doesn't redefine (and re-dispatch) them.
+Explicit signatures make numba compile (or load from its on-disk cache) at import;
+app.py imports this module from a background warm-up thread at startup, so neither
+the first paint nor the first Generate click waits on the JIT.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # No-op stand-in supporting both @njit and @njit(...)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
+NAK_SPAN = 360.0 / 27.0
+
+@njit("f8(f8, f8)", cache=True, fastmath=True)
+def wrap(x, period):
+    """x mod period in [0, period) without Python's sign-fixing branch: a mul, a floor and a sub."""
+    return x - period * math.floor(x / period)
+
+@njit("UniTuple(i8, 4)(f8, f8)", cache=True)
+def panch_core(sun, moon):
+    """Return (tithi, nakshatra, yoga, karana) indices for sidereal Sun/Moon longitudes."""
+    tithi = int(wrap(moon - sun, 360.0) // 12)
+    nak = int(moon // NAK_SPAN)
+    yoga = int(wrap(sun + moon, 360.0) // NAK_SPAN)
+    karana = (tithi * 2) % 11
+    return tithi, nak, yoga, karana
+
+@njit("f8[:, ::1](f8, f8[::1])", cache=True)
+def vim_core(moon_lon, years):
+    """Vimshottari sequence from the Moon's longitude.
+
+    years holds the dasha lengths in dasha order. Returns a (9,3) array of
+    (lord index, years, years from now); the first row is the balance of the birth dasha.
+    """
+    # Python-semantics // and % (numba keeps them) so index and fraction agree exactly on nakshatra
+    # boundaries; the floor-based wrap() can round the fraction just past 1 there
+    idx0 = int(moon_lon // NAK_SPAN) % 9
+    frac = (moon_lon % NAK_SPAN) / NAK_SPAN
+    out = np.empty((9, 3))
+    running = 0.0
+    for i in range(9):
+        li = (idx0 + i) % 9
+        y = years[li]
+        if i == 0:
+            y = (1 - frac) * y
+        out[i, 0] = li
+        out[i, 1] = y
+        out[i, 2] = running
+        running += y
+    return out
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Check the numeric kernels against the original pure-Python panchang/vimshottari math."""
+
+import random
+
+import numpy as np
+
+from kernels import NAK_SPAN, panch_core, vim_core
+
+VIM_YEARS = np.array([7, 20, 6, 10, 7, 18, 16, 19, 17], dtype=np.float64)
+
+def _panch_ref(sun, moon):
+    tithi = int(((moon - sun) % 360.0) // 12)
+    nak = int(moon // NAK_SPAN)
+    yoga = int(((sun + moon) % 360.0) // NAK_SPAN)
+    return tithi, nak, yoga, (tithi * 2) % 11
+
+def _vim_ref(moon_lon):
+    idx0 = int(moon_lon // NAK_SPAN) % 9
+    frac = (moon_lon % NAK_SPAN) / NAK_SPAN
+    seq, running = [], 0.0
+    for i in range(9):
+        li = (idx0 + i) % 9
+        years = (1 - frac) * VIM_YEARS[li] if i == 0 else VIM_YEARS[li]
+        seq.append((li, years, running))
+        running += years
+    return seq
+
+def _moon_values():
+    rng = random.Random(0)
+    values = [rng.uniform(0, 360) for _ in range(5000)]
+    # Every nakshatra boundary and the float just below it (e.g. Moon = 200 deg)
+    for k in range(28):
+        values.append(k * NAK_SPAN)
+        values.append(float(np.nextafter(k * NAK_SPAN, 0.0)))
+    return [v for v in values if 0.0 <= v < 360.0]
+
+def test_panch_core_matches_reference():
+    rng = random.Random(1)
+    for moon in _moon_values():
+        sun = rng.uniform(0, 360)
+        assert panch_core(sun, moon) == _panch_ref(sun, moon)
+
+def test_panch_core_tithi_boundaries():
+    rng = random.Random(2)
+    for _ in range(500):
+        sun = rng.uniform(0, 360)
+        for k in range(30):
+            moon = (sun + 12 * k) % 360.0
+            for m in (moon, float(np.nextafter(moon, 0.0))):
+                assert panch_core(sun, m) == _panch_ref(sun, m), (sun, m)
+
+def test_vim_core_matches_reference():
+    for moon in _moon_values():
+        got = vim_core(moon, VIM_YEARS).tolist()
+        for (li, years, from_now), (rli, ryears, rfrom) in zip(got, _vim_ref(moon)):
+            assert int(li) == rli, moon
+            assert abs(years - ryears) < 1e-9, moon
+            assert abs(from_now - rfrom) < 1e-9, moon
+
+def test_vim_core_balance_within_dasha():
+    for moon in _moon_values():
+        li, balance, _ = vim_core(moon, VIM_YEARS)[0]
+        assert 0.0 <= balance <= VIM_YEARS[int(li)], moon